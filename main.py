@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
+from tkinter import font as tkfont
 from pathlib import Path
 import subprocess, threading, shutil, os, time, shlex, json
 import uuid
 import webbrowser
+import base64
+import collections
+import functools
+import queue
+import re
+import socket
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 import sv_ttk
 import darkdetect
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import subprocess, threading, shutil, os, time, shlex, json, uuid, webbrowser, sys
 
 def resource_path(rel):
@@ -21,26 +35,138 @@ def resource_path(rel):
 
 APP_TITLE = "EZMount"
 STARTUP_PREFIX = "EZMount_"
-LOG_MAX_CHARS = 15000
+LOG_MAX_LINES = 500
+STARTUP_LOG_MAX = 256
+# Auto-generate assigns drives from X: downwards, wrapping to Z:/Y: last.
+DRIVE_LETTERS = "XWVUTSRQPONMLKJIHGFEDCBAZY"
+
+# Hide child console windows on Windows so taskkill/rclone spawns don't
+# flash a console; zero (no-op) elsewhere.
+NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0
+# Computed once: flags for fully detached children (no console, own group).
+DETACHED_FLAGS = (NO_WINDOW | getattr(subprocess, "DETACHED_PROCESS", 0)) if os.name == "nt" else 0
+
+# One shared rclone remote-control daemon serves all mounts when possible;
+# each extra mount then costs an HTTP call instead of a whole rclone process.
+# It binds an ephemeral localhost port with per-session credentials — the
+# daemon has the user's whole conf loaded, so it must not be drivable by
+# other local processes or by localhost CSRF from a browser.
+
+# Extra rclone mount flags per profile; rclone's defaults (single-stream
+# reads, 8 checkers) leave a lot of throughput on the table for most remotes.
+MOUNT_PROFILES = {
+    "fast": [
+        "--vfs-cache-mode", "writes",
+        "--transfers", "8", "--checkers", "16",
+        "--vfs-read-chunk-size", "8M", "--vfs-read-chunk-streams", "4",
+        "--dir-cache-time", "5m", "--attr-timeout", "1s",
+        "--no-modtime", "--no-checksum",
+    ],
+    "balanced": [
+        "--vfs-cache-mode", "writes",
+        "--vfs-read-chunk-size", "8M",
+        "--dir-cache-time", "5m", "--attr-timeout", "1s",
+    ],
+    "safe": ["--vfs-cache-mode", "writes"],
+}
+
+# The same profiles as mount/mount parameters, so the rcd path honours the
+# profile combobox exactly like the subprocess fallback does.
+RC_MOUNT_PROFILES = {
+    "fast": {
+        "vfsOpt": {"CacheMode": "writes", "ChunkSize": "8M", "ChunkStreams": 4,
+                   "DirCacheTime": "5m", "NoModTime": True, "NoChecksum": True},
+        "mountOpt": {"AttrTimeout": "1s"},
+    },
+    "balanced": {
+        "vfsOpt": {"CacheMode": "writes", "ChunkSize": "8M", "DirCacheTime": "5m"},
+        "mountOpt": {"AttrTimeout": "1s"},
+    },
+    "safe": {"vfsOpt": {"CacheMode": "writes"}},
+}
+
+# Section headers and key=value lines in one alternation; comments and blank
+# lines simply never match, so the whole scan happens inside the regex engine.
+_CONF_RE = re.compile(
+    r'^[ \t]*(?:\[(?P<sec>[^\]\n]+)\]|(?P<key>[^#=\s][^=\n]*?)[ \t]*=[ \t]*(?P<val>[^\n]*?))[ \t\r]*$',
+    re.MULTILINE)
+
+# Everything that isn't filename-safe gets stripped from startup labels;
+# the sub runs in C instead of a per-character Python generator.
+_UNSAFE_LABEL_RE = re.compile(r"[^A-Za-z0-9_-]+")
 
 def parse_conf_sections(conf_text: str):
     sections = {}
     current = None
-    for raw in conf_text.splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("[") and line.endswith("]"):
-            current = line[1:-1].strip()
+    for m in _CONF_RE.finditer(conf_text):
+        sec = m.group("sec")
+        if sec is not None:
+            current = sec.strip()
             sections[current] = {}
-            continue
-        if current is None:
-            continue
-        if "=" in line:
-            k, v = line.split("=", 1)
-            sections[current][k.strip()] = v.strip()
+        elif current is not None:
+            sections[current][m.group("key")] = m.group("val")
     return sections
 
+_conf_cache = {}
+
+def load_conf(path):
+    """
+    Read and parse an rclone.conf, caching results keyed by (mtime_ns, size)
+    so re-selecting an unchanged file skips both the re-read and the re-parse.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _conf_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1], cached[2]
+    # Read raw bytes and decode once ourselves; Path.read_text goes through
+    # an extra TextIOWrapper layer and buffer copy we don't need here.
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    sections = parse_conf_sections(text)
+    if len(_conf_cache) >= 8:
+        _conf_cache.pop(next(iter(_conf_cache)))
+    _conf_cache[path] = (key, text, sections)
+    return text, sections
+
+@functools.lru_cache(maxsize=8)
+def cached_which(name, path):
+    # shutil.which probes every PATH directory; keyed on PATH itself so the
+    # cache refreshes if the environment ever changes.
+    return shutil.which(name, path=path)
+
+def get_logical_drive_mask():
+    """
+    Windows drive-letter bitmap (bit 0 = A:) in one syscall, or None when
+    unavailable. Avoids a per-drive stat that can hang on dead network shares.
+    """
+    if os.name != "nt":
+        return None
+    try:
+        import ctypes
+        return ctypes.windll.kernel32.GetLogicalDrives()
+    except Exception:
+        return None
+
+def get_posix_mount_points():
+    """
+    Set of active mount points from /proc/self/mountinfo in one read, or None
+    where the file doesn't exist (non-Linux). Octal escapes like \\040 are
+    decoded per proc(5).
+    """
+    try:
+        with open("/proc/self/mountinfo", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    mounts = set()
+    for line in data.split(b"\n"):
+        fields = line.split(b" ")
+        if len(fields) > 4:
+            mounts.add(fields[4].decode("unicode_escape"))
+    return mounts
+
+@functools.lru_cache(maxsize=1)
 def get_startup_folder():
     if os.name == "nt":
         appdata = os.getenv("APPDATA")
@@ -50,6 +176,7 @@ def get_startup_folder():
     else:
         return Path.home() / ".config" / "autostart"
 
+@functools.lru_cache(maxsize=1)
 def get_app_dir():
     if os.name == "nt":
         appdata = os.getenv("APPDATA") or str(Path.home())
@@ -60,12 +187,30 @@ def get_app_dir():
     return p
 
 STARTUP_LOG_PATH = get_app_dir() / "startup_log.json"
-
-def ensure_startup_folder():
-    p = get_startup_folder()
-    if p:
-        p.mkdir(parents=True, exist_ok=True)
-    return p
+STATE_PATH = get_app_dir() / "state.json"
+
+# Startup-entry command templates; the per-mapping loop only substitutes
+# pre-quoted values instead of rebuilding the whole string each time.
+STARTUP_CMD_TMPL_NIRCMD = '"{nircmd}" exec hide "{rclone}" mount {remote} {drive} --config "{conf}" --vfs-cache-mode writes --log-file "%TEMP%\\rclone_{label}.log" --log-level INFO'
+STARTUP_CMD_TMPL_START = 'start "" /min "{rclone}" mount {remote} {drive} --config "{conf}" --vfs-cache-mode writes --log-file "%TEMP%\\rclone_{label}.log" --log-level INFO'
+STARTUP_DESKTOP_TMPL = (
+    "[Desktop Entry]\n"
+    "Type=Application\n"
+    "Name={prefix}{label}\n"
+    'Exec=sh -c "nohup {rclone} mount {remote} {drive} --config \\"{conf}\\" --vfs-cache-mode writes &> /dev/null &"\n'
+    "X-GNOME-Autostart-enabled=true\n"
+)
+
+def dump_json_bytes(obj):
+    # orjson when available, compact stdlib dump otherwise.
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def load_json_bytes(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class EZMountApp(tk.Tk):
     def __init__(self):
@@ -119,20 +264,70 @@ class EZMountApp(tk.Tk):
         self.geometry("1100x700")
 
         self.loaded_conf_path = None
-        self.loaded_conf_text = ""
+        self._mount_cmd_tail = ("--config", "")
+        self._last_gen_sections = None
+        self._restore_pending = False
+        self._conf_load_gen = 0
+        self._specs_gen = 0
         self.conf_sections = {}
+        self._conf_encrypted = False
 
-        self.mappings = []
+        self.mappings = {}
         self.active_mounts = []
+        self._mounts_by_drive = {}
+        self._active_rows = []
 
-        self.rclone_path = shutil.which("rclone")
+        # Resolved lazily; shutil.which walks the whole PATH, which is slow
+        # on deep PATHs and not needed just to show the window.
+        self._rclone_path = None
         self.startup_log = []
+        self._log_lines = collections.deque(maxlen=LOG_MAX_LINES)
+        self._log_queue = queue.Queue()
+        self._exited_q = queue.Queue()
+        # One dedicated worker launches all mounts: Popen returns immediately
+        # and the RC calls are quick, so extra threads only buy GIL handoffs —
+        # and a single worker means _ensure_rcd can never race itself.
+        self._mount_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mount")
+        # One writer serializes state.json saves: concurrent writers would
+        # race open/truncate/os.replace on the shared tmp path and could
+        # publish a torn snapshot.
+        self._state_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state")
+        self._rcd_proc = None
+        self._rcd_conf_path = None
+        self._rc_addr = None
+        self._rc_user = "ezmount"
+        self._rc_pass = uuid.uuid4().hex
+        self._rc_auth = "Basic " + base64.b64encode(f"{self._rc_user}:{self._rc_pass}".encode("ascii")).decode("ascii")
+        self._nircmd_path = None
+        self._drive_cache = {}
+        self._last_ext_scan = 0.0
+        self._scan_inflight = False
+        self._cell_editor = None
+        self._status_after = None
+        self._edit_target = None
+        # Env lookup + Path joins done once; every startup action reuses it.
+        self._startup_folder = get_startup_folder()
 
         self._build_ui()
         self._load_startup_log()
+        # Track interaction so the status poll can back off while idle.
+        self._last_user_event = time.monotonic()
+        self.bind_all("<Any-KeyPress>", self._note_user_event, add="+")
+        self.bind_all("<Any-Button>", self._note_user_event, add="+")
+        self.after(50, self._drain_log)
+        self.after(0, self._restore_state)
         self.after(300, self.scan_for_external_mounts)
         self.after(1000, self._refresh_status_periodic)
 
+    @property
+    def rclone_path(self):
+        if self._rclone_path is None:
+            self._rclone_path = cached_which("rclone", os.environ.get("PATH", "")) or ""
+        return self._rclone_path
+
+    def _show_rclone_path(self):
+        self.lbl_rclone.config(text=f"rclone: {self.rclone_path or '(not found)'}")
+
     def make_themed_text(self, parent, height=6, wrap=tk.NONE):
         frame = ttk.Frame(parent)
         text = tk.Text(frame, wrap=wrap, height=height, relief="flat", bd=0)
@@ -150,6 +345,9 @@ class EZMountApp(tk.Tk):
 
     def _build_ui(self):
         pad = 8
+        # One shared Font object: Tk measures the metrics once instead of
+        # re-resolving the tuple spec for every header label.
+        header_font = tkfont.Font(size=11, weight="bold")
 
         toolbar = ttk.Frame(self, padding=(pad, pad // 2))
         toolbar.pack(fill=tk.X)
@@ -159,12 +357,17 @@ class EZMountApp(tk.Tk):
         ttk.Button(toolbar, text="Clear mappings", command=self.clear_mappings).pack(side=tk.LEFT, padx=6)
         ttk.Label(toolbar, text="    ").pack(side=tk.LEFT)
         ttk.Button(toolbar, text="Mount All", command=self.mount_all).pack(side=tk.RIGHT)
+        self.var_profile = tk.StringVar(value="balanced")
+        ttk.Combobox(toolbar, textvariable=self.var_profile, values=list(MOUNT_PROFILES),
+                     state="readonly", width=9).pack(side=tk.RIGHT, padx=(0, 6))
+        ttk.Label(toolbar, text="Profile:").pack(side=tk.RIGHT)
         ttk.Button(toolbar, text="Unmount All", command=self.unmount_all).pack(side=tk.RIGHT, padx=6)
 
         self.lbl_conf = ttk.Label(toolbar, text="(no config loaded)")
         self.lbl_conf.pack(side=tk.LEFT, padx=(12, 0))
-        self.lbl_rclone = ttk.Label(toolbar, text=f"rclone: {self.rclone_path or '(not found)'}")
+        self.lbl_rclone = ttk.Label(toolbar, text="rclone: (checking...)")
         self.lbl_rclone.pack(side=tk.LEFT, padx=(12, 0))
+        self.after_idle(self._show_rclone_path)
 
         main_frame = ttk.Frame(self)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=pad, pady=(0, pad))
@@ -174,12 +377,22 @@ class EZMountApp(tk.Tk):
         left.place(relx=0.0, rely=0.0, relwidth=0.30, relheight=1.0)
         right.place(relx=0.30, rely=0.0, relwidth=0.70, relheight=1.0)
 
-        ttk.Label(left, text="rclone.conf (read-only)", font=(None, 11, "bold")).pack(anchor="w")
-        conf_frame, self.txt_conf = self.make_themed_text(left, wrap=tk.NONE, height=20)
+        ttk.Label(left, text="rclone.conf (read-only)", font=header_font).pack(anchor="w")
+        # A Listbox only renders the visible rows, so huge configs stay
+        # cheap to display/scroll; the Text widget laid out every line eagerly.
+        conf_frame = ttk.Frame(left)
+        self.lst_conf = tk.Listbox(conf_frame, activestyle="none")
+        try:
+            self.lst_conf.configure(bg=self._bg_text, fg=self._fg_text, highlightthickness=0)
+        except Exception:
+            pass
+        conf_vs = ttk.Scrollbar(conf_frame, orient="vertical", command=self.lst_conf.yview)
+        self.lst_conf.configure(yscrollcommand=conf_vs.set)
+        conf_vs.pack(side="right", fill="y")
+        self.lst_conf.pack(side="left", fill="both", expand=True)
         conf_frame.pack(fill=tk.BOTH, expand=True, pady=(6, 0))
-        self.txt_conf.configure(state="disabled")
 
-        ttk.Label(right, text="Mappings", font=(None, 11, "bold")).pack(anchor="w")
+        ttk.Label(right, text="Mappings", font=header_font).pack(anchor="w")
 
         tree_container = ttk.Frame(right)
         tree_container.pack(fill=tk.BOTH, expand=True)
@@ -229,50 +442,100 @@ class EZMountApp(tk.Tk):
 
         leftb = ttk.Frame(bottom)
         leftb.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ttk.Label(leftb, text="Active mounts", font=(None, 11, "bold")).pack(anchor="w")
+        ttk.Label(leftb, text="Active mounts", font=header_font).pack(anchor="w")
         self.lst_active = tk.Listbox(leftb, height=6)
         self.lst_active.pack(fill=tk.BOTH, expand=True, pady=(6, 0))
 
         midb = ttk.Frame(bottom)
         midb.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(8, 8))
-        ttk.Label(midb, text="Console (last messages)", font=(None, 11, "bold")).pack(anchor="w")
+        ttk.Label(midb, text="Console (last messages)", font=header_font).pack(anchor="w")
         log_frame, self.txt_log = self.make_themed_text(midb, height=6)
         log_frame.pack(fill=tk.BOTH, expand=True, pady=(6, 0))
         self.txt_log.configure(state="disabled")
 
         rightb = ttk.Frame(bottom)
         rightb.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ttk.Label(rightb, text="Startup (system)", font=(None, 11, "bold")).pack(anchor="w")
+        ttk.Label(rightb, text="Startup (system)", font=header_font).pack(anchor="w")
         sp = ttk.Frame(rightb)
         sp.pack(pady=(6, 0))
         ttk.Button(sp, text="Add selected to startup", command=self.add_selected_to_startup).pack(side=tk.LEFT)
         ttk.Button(sp, text="Clear EZMount startups", command=self.clear_startups).pack(side=tk.LEFT, padx=(6, 0))
-        self.lbl_startup = ttk.Label(rightb, text="Startup folder: " + str(get_startup_folder()))
+        self.lbl_startup = ttk.Label(rightb, text="Startup folder: " + str(self._startup_folder))
         self.lbl_startup.pack(anchor="w", pady=(6, 0))
         ttk.Button(rightb, text="Open startup folder", command=self.open_startup_folder).pack(side=tk.BOTTOM, pady=(6, 0))
 
+        # Status bar for per-action notices; unlike a messagebox it never
+        # nests an event loop, so repeated actions stay fluid.
+        self.status_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.status_var, anchor="w", padding=(pad, 2)).pack(side=tk.BOTTOM, fill=tk.X)
+
+    def _set_status(self, msg, clear_after=3000):
+        self.status_var.set(msg)
+        if self._status_after is not None:
+            try:
+                self.after_cancel(self._status_after)
+            except Exception:
+                pass
+        self._status_after = self.after(clear_after, lambda: self.status_var.set(""))
+
     # ---------- config load ----------
     def select_conf(self):
         p = filedialog.askopenfilename(title="Select rclone.conf", filetypes=[("conf", "*.conf"), ("All", "*.*")])
         if not p:
             return
+        # Read + parse on a worker thread so a large conf never freezes the
+        # window; the result is applied back on the Tk thread.
+        threading.Thread(target=self._load_conf_worker, args=(p,), daemon=True).start()
+
+    def _load_conf_worker(self, p):
         try:
-            text = Path(p).read_text(encoding="utf-8")
+            text, sections = load_conf(p)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to read file:\n{e}")
+            self.after(0, lambda e=e: messagebox.showerror("Error", f"Failed to read file:\n{e}"))
             return
-        self.loaded_conf_path = p
-        self.loaded_conf_text = text
-        self.conf_sections = parse_conf_sections(text)
+        self.after(0, self._apply_loaded_conf, p, text, sections)
 
-        self.txt_conf.configure(state="normal")
-        self.txt_conf.delete("1.0", tk.END)
-        self.txt_conf.insert(tk.END, text)
-        self.txt_conf.configure(state="disabled")
+    def _apply_loaded_conf(self, p, text, sections):
+        self.loaded_conf_path = p
+        # The raw text isn't retained on the instance: nothing reads it after
+        # this method, the viewer holds its own copy as Listbox items and a
+        # warm reload comes out of the load_conf cache anyway.
+        self.conf_sections = sections
+        # The config flags never change between mounts of the same conf, so
+        # build the shared argv tail once instead of per mount.
+        self._mount_cmd_tail = ("--config", p)
+        # Checked once here so mount time never has to sniff the file again;
+        # encrypted configs can't answer rclone's password prompt when the
+        # process is detached with stdin on DEVNULL.
+        self._conf_encrypted = text.lstrip().startswith("# Encrypted rclone configuration") or "RCLONE_ENCRYPT_V0" in text[:256]
+        if self._conf_encrypted:
+            self._log("Config appears encrypted; set RCLONE_CONFIG_PASS before mounting (detached mounts cannot prompt).")
+
+        self._conf_load_gen += 1
+        self.lst_conf.delete(0, tk.END)
+        self._insert_conf_lines(text.splitlines(), self._conf_load_gen)
 
         self.lbl_conf.config(text=Path(p).name)
+        if self._restore_pending:
+            # The snapshot's mtime check already proved this conf is the one
+            # the restored mappings were built against, so prime the guard
+            # and let auto_generate_mappings keep them.
+            self._restore_pending = False
+            self._last_gen_sections = sections
         self.auto_generate_mappings()
-        self.scan_for_external_mounts()
+        self.scan_for_external_mounts(force=True)
+
+    def _insert_conf_lines(self, lines, gen, chunk=2000):
+        # Feed the viewer a block at a time between event-loop ticks so a
+        # multi-MB conf never stalls the window on one giant insert. The
+        # generation token kills a stale chain when another conf loads while
+        # chunks are still pending.
+        if gen != self._conf_load_gen:
+            return
+        self.lst_conf.insert(tk.END, *lines[:chunk])
+        rest = lines[chunk:]
+        if rest:
+            self.after_idle(lambda: self._insert_conf_lines(rest, gen, chunk))
 
     # ---------- mappings (treeview) ----------
     def _new_iid(self):
@@ -283,7 +546,7 @@ class EZMountApp(tk.Tk):
             label = remote
         iid = self._new_iid()
         m = {"id": iid, "remote": remote, "label": label, "drive": drive, "startup": bool(startup)}
-        self.mappings.append(m)
+        self.mappings[iid] = m
         startup_text = "Yes" if m["startup"] else ""
         self.tree.insert("", "end", iid, values=(m["remote"], m["label"], m["drive"], startup_text))
         if select:
@@ -291,18 +554,10 @@ class EZMountApp(tk.Tk):
             self.tree.see(iid)
 
     def _find_mapping_by_iid(self, iid):
-        for m in self.mappings:
-            if m["id"] == iid:
-                return m
-        return None
+        return self.mappings.get(iid)
 
     def _remove_mapping_by_iid(self, iid):
-        m = self._find_mapping_by_iid(iid)
-        if m:
-            try:
-                self.mappings.remove(m)
-            except Exception:
-                pass
+        self.mappings.pop(iid, None)
         try:
             self.tree.delete(iid)
         except Exception:
@@ -313,38 +568,167 @@ class EZMountApp(tk.Tk):
             return
         if not messagebox.askyesno("Clear mappings", "Clear all mappings?"):
             return
+        # Invalidate any insert chain still pending from an auto-generate so
+        # it can't repopulate the tree we just emptied.
+        self._specs_gen += 1
         self.mappings.clear()
         for iid in self.tree.get_children():
             self.tree.delete(iid)
+        self._save_state()
 
     def auto_generate_mappings(self):
-        self.clear_mappings()
         if not self.conf_sections:
+            # No conf loaded yet, or an encrypted conf that parsed to
+            # nothing: generating from zero sections would wipe every
+            # existing row and persist the empty set. Keep what's there.
+            self._log("No remotes to generate mappings from; keeping existing rows.")
+            return
+        # Reopening the same (unchanged) conf shouldn't tear down and rebuild
+        # the tree, or re-ask about buckets.
+        if self.conf_sections == self._last_gen_sections and self.mappings:
+            self._log("Conf unchanged; keeping existing mappings.")
             return
-        drive_ord = ord("X")
+        self._last_gen_sections = self.conf_sections
+        # First pass: no dialogs, just collect which remotes look like S3.
+        s3_sections = []
+        entries = []
         for section, kv in self.conf_sections.items():
             type_val = kv.get("type", "").lower()
             bucket_val = kv.get("bucket") or kv.get("bucket_name")
             if type_val == "s3" or bucket_val:
+                s3_sections.append(section)
+                entries.append((section, bucket_val))
+            else:
+                entries.append((section, None))
+        # One consolidated prompt for all S3 remotes instead of a modal
+        # dialog pair per remote inside the loop.
+        extra_buckets = self._ask_extra_buckets(s3_sections) if s3_sections else {}
+
+        # One drive-mask fetch up front lets us hand out only letters that are
+        # actually free, so Mount All doesn't hit in-use prompts later.
+        mask = get_logical_drive_mask()
+        if mask is not None:
+            letters = [L for L in DRIVE_LETTERS if not (mask >> (ord(L) - 65)) & 1] or DRIVE_LETTERS
+        else:
+            letters = DRIVE_LETTERS
+
+        specs = []
+        for section, bucket_val in entries:
+            if bucket_val or section in s3_sections:
                 if bucket_val:
-                    self.add_mapping_row(remote=f"{section}:{bucket_val}", label=f"{section}-{bucket_val}", drive=f"{chr(drive_ord)}:")
-                    drive_ord = self._next_drive_ord(drive_ord)
-                add_more = messagebox.askyesno("Additional buckets?", f"Remote '{section}' looks like S3 or has a bucket.\nAdd more buckets?")
-                if add_more:
-                    bucket_input = simpledialog.askstring("Buckets", f"Enter bucket names for '{section}' (comma-separated):")
-                    if bucket_input:
-                        for b in [x.strip() for x in bucket_input.split(",") if x.strip()]:
-                            self.add_mapping_row(remote=f"{section}:{b}", label=f"{section}-{b}", drive=f"{chr(drive_ord)}:")
-                            drive_ord = self._next_drive_ord(drive_ord)
+                    specs.append((f"{section}:{bucket_val}", f"{section}-{bucket_val}", f"{letters[len(specs) % len(letters)]}:"))
+                for b in extra_buckets.get(section, []):
+                    specs.append((f"{section}:{b}", f"{section}-{b}", f"{letters[len(specs) % len(letters)]}:"))
                 continue
-            self.add_mapping_row(remote=f"{section}:", label=section, drive=f"{chr(drive_ord)}:")
-            drive_ord = self._next_drive_ord(drive_ord)
+            specs.append((f"{section}:", section, f"{letters[len(specs) % len(letters)]}:"))
+        self._apply_mapping_specs(specs)
+
+    def _ask_extra_buckets(self, s3_sections):
+        dlg = tk.Toplevel(self)
+        dlg.title("Additional buckets")
+        dlg.transient(self)
+        ttk.Label(dlg, text="Extra bucket names per remote (comma-separated, optional):").grid(
+            row=0, column=0, columnspan=2, sticky="w", padx=8, pady=(8, 4))
+        entries = {}
+        for i, section in enumerate(s3_sections, start=1):
+            ttk.Label(dlg, text=section).grid(row=i, column=0, sticky="w", padx=8, pady=2)
+            e = ttk.Entry(dlg, width=40)
+            e.grid(row=i, column=1, sticky="ew", padx=8, pady=2)
+            entries[section] = e
+        result = {}
+        def ok():
+            for section, e in entries.items():
+                buckets = [b.strip() for b in e.get().split(",") if b.strip()]
+                if buckets:
+                    result[section] = buckets
+            dlg.destroy()
+        ttk.Button(dlg, text="OK", command=ok).grid(
+            row=len(s3_sections) + 1, column=1, sticky="e", padx=8, pady=8)
+        dlg.bind("<Return>", lambda e: ok())
+        try:
+            dlg.grab_set()
+        except Exception:
+            pass
+        dlg.wait_window()
+        return result
+
+    def _apply_mapping_specs(self, specs):
+        # Reuse existing Treeview rows in place rather than deleting and
+        # recreating everything on each auto-generate; only the surplus or
+        # missing rows are actually removed/inserted.
+        existing = self.tree.get_children()
+        reused = min(len(existing), len(specs))
+        for i in range(reused):
+            iid = existing[i]
+            remote, label, drive = specs[i]
+            m = self._find_mapping_by_iid(iid)
+            if m:
+                m.update(remote=remote, label=label, drive=drive, startup=False)
+            self.tree.item(iid, values=(remote, label, drive, ""))
+        for iid in existing[len(specs):]:
+            self._remove_mapping_by_iid(iid)
+        self._specs_gen += 1
+        self._insert_specs_chunked(specs[reused:], self._specs_gen)
+
+    def _insert_specs_chunked(self, specs, gen, chunk=20):
+        # Insert new rows a screenful at a time between event-loop ticks so
+        # huge configs populate without hanging the window. The generation
+        # token kills a stale chain when a conf switch or Clear mappings
+        # lands while chunks are still pending, so old rows never interleave
+        # into the fresh tree (or get saved as state).
+        if gen != self._specs_gen:
+            return
+        for remote, label, drive in specs[:chunk]:
+            self.add_mapping_row(remote=remote, label=label, drive=drive)
+        rest = specs[chunk:]
+        if rest:
+            self.after_idle(lambda: self._insert_specs_chunked(rest, gen, chunk))
+        else:
+            self._save_state()
+
+    def _save_state(self):
+        # Snapshot the session so the next launch can skip reselecting and
+        # reparsing the conf. Snapshot on the Tk thread, write on a worker.
+        if not self.loaded_conf_path:
+            return
+        try:
+            mtime_ns = os.stat(self.loaded_conf_path).st_mtime_ns
+        except OSError:
+            return
+        # Only the conf path + mtime go in; the parsed sections would copy
+        # every credential in the conf into a second plaintext file, and the
+        # mtime check is all the unchanged-conf guard needs.
+        state = {
+            "conf_path": self.loaded_conf_path,
+            "mtime_ns": mtime_ns,
+            "mappings": [{k: m[k] for k in ("remote", "label", "drive", "startup")} for m in self.mappings.values()],
+        }
+        def write():
+            try:
+                tmp = STATE_PATH.with_suffix(".json.tmp")
+                tmp.write_bytes(dump_json_bytes(state))
+                os.replace(tmp, STATE_PATH)
+            except Exception:
+                pass
+        self._state_executor.submit(write)
 
-    def _next_drive_ord(self, ord_val):
-        ord_val -= 1
-        if ord_val < ord("A"):
-            ord_val = ord("Z")
-        return ord_val
+    def _restore_state(self):
+        try:
+            state = load_json_bytes(STATE_PATH.read_bytes())
+            p = state["conf_path"]
+            if os.stat(p).st_mtime_ns != state["mtime_ns"]:
+                return
+        except Exception:
+            return
+        # Mappings come straight from the snapshot; the pending-restore flag
+        # makes _apply_loaded_conf prime the auto-generate guard when the conf
+        # finishes loading, so the restored rows (and their startup flags) are
+        # kept as-is.
+        self._restore_pending = True
+        for m in state.get("mappings", []):
+            self.add_mapping_row(remote=m.get("remote", ""), label=m.get("label"), drive=m.get("drive", ""), startup=m.get("startup", False))
+        self._log(f"Restored previous session for {p}")
+        threading.Thread(target=self._load_conf_worker, args=(p,), daemon=True).start()
 
     def _on_tree_double_click(self, event):
         region = self.tree.identify("region", event.x, event.y)
@@ -361,26 +745,49 @@ class EZMountApp(tk.Tk):
             return
         x, y, w, h = bbox
         edit_value = self.tree.set(row, column)
-        entry = ttk.Entry(self.tree)
+        entry = self._get_cell_editor()
+        self._edit_target = (row, column, col_key)
+        entry.delete(0, "end")
         entry.insert(0, edit_value)
         entry.place(x=x, y=y, width=w, height=h)
         entry.focus_set()
-        def commit(event=None):
-            new = entry.get().strip()
-            entry.destroy()
-            if col_key == "startup":
-                new_bool = bool(new and new.lower() not in ("", "no", "false", "0"))
-                m = self._find_mapping_by_iid(row)
-                if m:
-                    m["startup"] = new_bool
-                    self.tree.set(row, column, "Yes" if new_bool else "")
-            else:
-                self.tree.set(row, column, new)
-                m = self._find_mapping_by_iid(row)
-                if m:
-                    m[col_key] = new
-        entry.bind("<Return>", commit)
-        entry.bind("<FocusOut>", commit)
+
+    def _get_cell_editor(self):
+        # One Entry is reused for every in-place edit instead of creating and
+        # destroying a widget (plus its bindings) per double-click.
+        if self._cell_editor is None:
+            e = ttk.Entry(self.tree)
+            e.bind("<Return>", self._commit_cell_edit)
+            e.bind("<FocusOut>", self._commit_cell_edit)
+            e.bind("<Escape>", self._cancel_cell_edit)
+            self._cell_editor = e
+        return self._cell_editor
+
+    def _cancel_cell_edit(self, _event=None):
+        self._edit_target = None
+        self._cell_editor.place_forget()
+
+    def _commit_cell_edit(self, _event=None):
+        # Guard against the FocusOut that hiding the editor itself triggers.
+        if self._edit_target is None:
+            return
+        row, column, col_key = self._edit_target
+        self._edit_target = None
+        entry = self._cell_editor
+        new = entry.get().strip()
+        entry.place_forget()
+        if col_key == "startup":
+            new_bool = bool(new and new.lower() not in ("", "no", "false", "0"))
+            m = self._find_mapping_by_iid(row)
+            if m:
+                m["startup"] = new_bool
+                self.tree.set(row, column, "Yes" if new_bool else "")
+        else:
+            self.tree.set(row, column, new)
+            m = self._find_mapping_by_iid(row)
+            if m:
+                m[col_key] = new
+        self._save_state()
 
     def _get_selected_mapping(self):
         sel = self.tree.selection()
@@ -393,33 +800,35 @@ class EZMountApp(tk.Tk):
     def action_mount_selected(self):
         iid, m = self._get_selected_mapping()
         if not m:
-            messagebox.showinfo("Select", "Select a mapping first")
+            self._set_status("Select a mapping first")
             return
         self._mount_single(m["remote"], m["drive"])
 
     def action_unmount_selected(self):
         iid, m = self._get_selected_mapping()
         if not m:
-            messagebox.showinfo("Select", "Select a mapping first")
+            self._set_status("Select a mapping first")
             return
         self._unmount_single(m["drive"])
 
     def action_toggle_startup(self):
         iid, m = self._get_selected_mapping()
         if not m:
-            messagebox.showinfo("Select", "Select a mapping first")
+            self._set_status("Select a mapping first")
             return
         m["startup"] = not m["startup"]
         self.tree.set(iid, "startup", "Yes" if m["startup"] else "")
+        self._save_state()
 
     def action_remove_selected(self):
         iid, m = self._get_selected_mapping()
         if not m:
-            messagebox.showinfo("Select", "Select a mapping first")
+            self._set_status("Select a mapping first")
             return
         if not messagebox.askyesno("Remove", f"Remove mapping '{m['label']}'?"):
             return
         self._remove_mapping_by_iid(iid)
+        self._save_state()
 
     def show_add_mapping_dialog(self):
         remote = simpledialog.askstring("Remote", "Remote (eg. remote:bucket):", parent=self)
@@ -429,25 +838,26 @@ class EZMountApp(tk.Tk):
         drive = simpledialog.askstring("Drive", "Drive (eg. X: or /mnt/point):", parent=self) or "X:"
         startup_ans = messagebox.askyesno("Startup", "Add to startup by default?")
         self.add_mapping_row(remote=remote.strip(), label=label.strip(), drive=drive.strip(), startup=startup_ans, select=True)
+        self._save_state()
 
     # ---------- mount (detached) ----------
     def mount_all(self):
         if not self.rclone_path:
             messagebox.showerror("Missing rclone", "rclone not found on PATH")
             return
-        to_mount = []
-        for m in self.mappings:
-            r = m["remote"].strip()
-            d = m["drive"].strip()
-            if not r:
-                continue
-            if self._is_drive_in_use(d):
-                skip = messagebox.askyesno("Drive in use", f"{d} appears in use. Skip this mapping?")
-                if skip:
-                    continue
-            to_mount.append((r, d))
+        to_mount = [(m["remote"].strip(), m["drive"].strip()) for m in self.mappings.values() if m["remote"].strip()]
+        mask = get_logical_drive_mask()
+        in_use = [d for r, d in to_mount if self._is_drive_in_use(d, mask)]
+        if in_use:
+            # One consolidated prompt instead of a dialog per busy drive.
+            skip = messagebox.askyesno("Drives in use", "These drives appear in use:\n" + ", ".join(in_use) + "\nSkip them?")
+            if skip:
+                to_mount = [(r, d) for r, d in to_mount if d not in in_use]
+        # Read the Tk variable here: StringVar.get from the worker thread can
+        # raise on thread-enabled Tcl builds and silently kill the mount.
+        profile = self.var_profile.get()
         for r, d in to_mount:
-            threading.Thread(target=self._start_detached_mount, args=(r, d), daemon=True).start()
+            self._mount_executor.submit(self._start_detached_mount, r, d, profile)
 
     def _mount_single(self, remote, drive):
         if not self.rclone_path:
@@ -456,214 +866,474 @@ class EZMountApp(tk.Tk):
         if not remote:
             messagebox.showwarning("No remote", "Remote is empty")
             return
-        threading.Thread(target=self._start_detached_mount, args=(remote, drive), daemon=True).start()
+        self._mount_executor.submit(self._start_detached_mount, remote, drive, self.var_profile.get())
+
+    def _rc_call(self, path, params=None):
+        req = urllib.request.Request(
+            f"http://{self._rc_addr}/{path}",
+            data=json.dumps(params or {}).encode("utf-8"),
+            headers={"Content-Type": "application/json", "Authorization": self._rc_auth})
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return json.loads(resp.read().decode("utf-8") or "{}")
+
+    def _ensure_rcd(self):
+        conf = self.loaded_conf_path or ""
+        if not conf:
+            # Nothing to serve yet; don't park an authenticated daemon with
+            # an empty conf just to fail every mount call.
+            return False
+        if self._rcd_proc is not None and self._rcd_proc.poll() is None:
+            if self._rcd_conf_path == conf:
+                return True
+            if any(am.get("rc") for am in self.active_mounts):
+                # The daemon still hosts live mounts from the previous conf;
+                # killing it would drop them (and any pending vfs-cache
+                # writes). Fall back to subprocess mounts until the user
+                # unmounts them.
+                self._log("rcd still hosts mounts from the previous conf; using rclone mount until they are unmounted")
+                return False
+            # The daemon only knows the conf it was started with; after a
+            # conf switch every mount call would fail on unknown remotes,
+            # so restart it against the new one.
+            self._log("Conf changed; restarting rclone rcd")
+            try:
+                self._rcd_proc.terminate()
+                try:
+                    self._rcd_proc.wait(timeout=3)
+                except Exception:
+                    self._rcd_proc.kill()
+            except Exception:
+                pass
+            self._rcd_proc = None
+        if not self.rclone_path:
+            return False
+        # A fresh ephemeral port per spawn: no well-known port for another
+        # process to squat on or collide with.
+        try:
+            with socket.socket() as s:
+                s.bind(("127.0.0.1", 0))
+                port = s.getsockname()[1]
+        except OSError as e:
+            self._log(f"Failed to pick a port for rclone rcd: {e}")
+            return False
+        addr = f"127.0.0.1:{port}"
+        cmd = [self.rclone_path, "rcd", f"--rc-addr={addr}",
+               f"--rc-user={self._rc_user}", f"--rc-pass={self._rc_pass}",
+               "--config", conf]
+        try:
+            if os.name == "nt":
+                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=DETACHED_FLAGS)
+            else:
+                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+        except Exception as e:
+            self._log(f"Failed to start rclone rcd: {e}")
+            return False
+        self._rc_addr = addr
+        # Give the daemon a moment to bind before declaring it usable.
+        deadline = time.time() + 3
+        while time.time() < deadline:
+            if proc.poll() is not None:
+                return False
+            try:
+                # core/pid proves the responder is the process we just
+                # spawned, not some other daemon that got the port first.
+                if self._rc_call("core/pid").get("pid") != proc.pid:
+                    break
+                self._rcd_proc = proc
+                self._rcd_conf_path = conf
+                self._log(f"rclone rcd running on {addr} (pid={proc.pid})")
+                return True
+            except Exception:
+                time.sleep(0.1)
+        # Never bound in time (or a stranger answered): kill it rather than
+        # leak an orphan rclone per failed attempt.
+        try:
+            proc.kill()
+        except Exception:
+            pass
+        return False
 
-    def _start_detached_mount(self, remote, drive):
+    def _start_detached_mount(self, remote, drive, profile_name):
         if not self.rclone_path:
             self._log("rclone not found; cannot mount.")
             return
-        cmd = [self.rclone_path, "mount", remote, drive, "--config", self.loaded_conf_path or "", "--vfs-cache-mode", "writes"]
+        # Preferred path: one shared rcd daemon, one cheap RC call per mount.
+        if self._ensure_rcd():
+            try:
+                params = {"fs": remote, "mountPoint": drive}
+                params.update(RC_MOUNT_PROFILES.get(profile_name) or RC_MOUNT_PROFILES["balanced"])
+                self._rc_call("mount/mount", params)
+                mapping_text = f"{remote} -> {drive}"
+                self._add_mount({"mapping": mapping_text, "drive": drive, "proc": None, "rc": True, "started_at": time.time(), "detected": False})
+                self._refresh_active_list()
+                self._log(f"Mounted (rcd): {mapping_text}")
+                return
+            except Exception as e:
+                self._log(f"RC mount failed for {remote} -> {drive}: {e}; falling back to rclone mount")
+        profile = MOUNT_PROFILES.get(profile_name) or MOUNT_PROFILES["balanced"]
+        # Logs go through --log-file rather than a stderr pipe held by the
+        # GUI: once we exit, a closed pipe makes rclone's next stderr write
+        # fatal (Go treats EPIPE on fd 2 as fatal), killing "detached"
+        # mounts. The reader thread tails the file instead.
+        log_path = get_app_dir() / f"mount_{_UNSAFE_LABEL_RE.sub('', drive) or 'mount'}.log"
+        try:
+            log_path.write_bytes(b"")
+        except OSError:
+            pass
+        cmd = [self.rclone_path, "mount", remote, drive, *self._mount_cmd_tail, *profile,
+               "--log-file", str(log_path), "--log-level", "INFO"]
         self._log(f"Starting (detached): {shlex.join(cmd)}")
         try:
             if os.name == "nt":
-                creation = 0
-                if hasattr(subprocess, "CREATE_NO_WINDOW"):
-                    creation |= subprocess.CREATE_NO_WINDOW
-                if hasattr(subprocess, "DETACHED_PROCESS"):
-                    creation |= subprocess.DETACHED_PROCESS
-                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creation)
+                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=DETACHED_FLAGS)
             else:
-                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, preexec_fn=os.setpgrp)
+                proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
         except Exception as e:
             self._log(f"Failed to start detached mount {remote} -> {drive}: {e}")
             return
 
         mapping_text = f"{remote} -> {drive}"
-        self.active_mounts.append({"mapping": mapping_text, "proc": proc, "started_at": time.time(), "detected": False})
+        threading.Thread(target=self._pump_mount_output, args=(proc, mapping_text, log_path), daemon=True).start()
+        self._add_mount({"mapping": mapping_text, "drive": drive, "proc": proc, "started_at": time.time(), "detected": False})
         self._refresh_active_list()
         self._log(f"Mounted (detached): {mapping_text} (pid={proc.pid})")
 
-    def _is_drive_in_use(self, d):
+    def _pump_mount_output(self, proc, mapping_text, log_path):
+        # Tail the mount's --log-file while the process lives; nothing here
+        # keeps an fd of the child's open, so the mount survives the GUI.
+        f = None
+        try:
+            while True:
+                if f is None:
+                    try:
+                        f = open(log_path, "r", encoding="utf-8", errors="replace")
+                    except OSError:
+                        f = None
+                line = f.readline() if f is not None else ""
+                if line:
+                    line = line.rstrip()
+                    if line:
+                        self._log(f"[{mapping_text}] {line}")
+                    continue
+                if proc.poll() is not None:
+                    # One last read catches lines written between the empty
+                    # readline and the exit.
+                    if f is not None:
+                        for line in f:
+                            line = line.rstrip()
+                            if line:
+                                self._log(f"[{mapping_text}] {line}")
+                    break
+                time.sleep(0.5)
+        except Exception:
+            pass
+        finally:
+            if f is not None:
+                try:
+                    f.close()
+                except Exception:
+                    pass
+        # The process is going away: reap it here and tell the UI, so the
+        # periodic tick never has to poll() healthy mounts.
+        try:
+            proc.wait()
+        except Exception:
+            pass
+        self._exited_q.put(proc)
+
+    def _add_mount(self, am):
+        # active_mounts keeps insertion order for the list pane; the dict is a
+        # drive-keyed index so unmount paths never scan the list.
+        self.active_mounts.append(am)
+        # started_at never changes, so render it once here instead of
+        # re-running strftime per row on every refresh.
+        t = am.get("started_at")
+        am["started_str"] = time.strftime("%H:%M:%S", time.localtime(t)) if t else "-"
+        drive = am.get("drive")
+        if drive:
+            cur = self._mounts_by_drive.get(drive)
+            # A detected entry (e.g. a stale startup-log line sharing the
+            # drive) must not steal the index slot from a proc/rc-backed
+            # mount, or Unmount on that drive would take the external-mount
+            # path (taskkill on Windows) instead of stopping our own process.
+            if not (am.get("detected") and cur is not None and (cur.get("proc") or cur.get("rc"))):
+                self._mounts_by_drive[drive] = am
+
+    def _drop_mount(self, am):
+        try:
+            self.active_mounts.remove(am)
+        except ValueError:
+            pass
+        drive = am.get("drive")
+        if drive and self._mounts_by_drive.get(drive) is am:
+            del self._mounts_by_drive[drive]
+
+    def _is_drive_in_use(self, d, mask=None):
         if not d:
             return False
         if os.name == "nt" and len(d) >= 2 and d[1] == ":":
-            return Path(d[0:2] + "\\").exists()
-        return Path(d).exists()
+            if mask is None:
+                mask = get_logical_drive_mask()
+            if mask is not None:
+                return bool(mask & (1 << (ord(d[0].upper()) - ord("A"))))
+            return self._probe_path(d[0:2] + "\\")
+        return self._probe_path(d)
+
+    def _probe_path(self, path):
+        # Short-TTL memo for the stat-based probes; the periodic scan hits
+        # the same paths every couple of seconds.
+        now = time.monotonic()
+        hit = self._drive_cache.get(path)
+        if hit is not None and now - hit[0] < 0.5:
+            return hit[1]
+        val = Path(path).exists()
+        self._drive_cache[path] = (now, val)
+        return val
 
     # ---------- unmount ----------
     def _unmount_single(self, drive):
         if not drive:
-            messagebox.showinfo("No drive", "No drive specified")
-            return
-        found = False
-        for am in list(self.active_mounts):
-            if am["mapping"].endswith(f"-> {drive}") or drive in am["mapping"]:
-                found = True
-                proc = am.get("proc")
-                if proc:
+            self._set_status("No drive specified")
+            return
+        am = self._mounts_by_drive.get(drive)
+        if am is None:
+            self._set_status(f"No active mount matching {drive}")
+            return
+        proc = am.get("proc")
+        if am.get("rc"):
+            try:
+                self._rc_call("mount/unmount", {"mountPoint": drive})
+                self._log(f"Unmounted via rcd: {am['mapping']}")
+            except Exception as e:
+                self._log(f"RC unmount failed for {drive}: {e}")
+            self._drop_mount(am)
+            self._refresh_active_list()
+        elif proc:
+            try:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=3)
+                except Exception:
+                    proc.kill()
+            except Exception as e:
+                self._log(f"Error stopping pid {getattr(proc, 'pid', None)}: {e}")
+            self._drop_mount(am)
+            self._refresh_active_list()
+            self._log(f"Stopped mount {am['mapping']}")
+        else:
+            do_it = messagebox.askyesno("External mount", f"This mount ({am['mapping']}) wasn't started by EZMount.\nTry to unmount/stop it anyway?")
+            if not do_it:
+                return
+            self._log(f"Attempting to unmount external mount: {am['mapping']}")
+            if os.name == "nt":
+                try:
+                    subprocess.run(["taskkill", "/f", "/im", "rclone.exe"], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=NO_WINDOW, close_fds=True)
+                    self._log("Requested taskkill for rclone.exe (Windows).")
+                except Exception as e:
+                    self._log(f"Failed to taskkill rclone.exe: {e}")
+            else:
+                try:
+                    subprocess.run(["fusermount", "-u", drive], check=False)
+                    self._log(f"Ran fusermount -u {drive}")
+                except Exception:
                     try:
-                        proc.terminate()
-                        try:
-                            proc.wait(timeout=3)
-                        except Exception:
-                            proc.kill()
+                        subprocess.run(["umount", drive], check=False)
+                        self._log(f"Ran umount {drive}")
                     except Exception as e:
-                        self._log(f"Error stopping pid {getattr(proc, 'pid', None)}: {e}")
-                    try:
-                        self.active_mounts.remove(am)
-                    except ValueError:
-                        pass
-                    self._refresh_active_list()
-                    self._log(f"Stopped mount {am['mapping']}")
-                else:
-                    do_it = messagebox.askyesno("External mount", f"This mount ({am['mapping']}) wasn't started by EZMount.\nTry to unmount/stop it anyway?")
-                    if not do_it:
-                        return
-                    self._log(f"Attempting to unmount external mount: {am['mapping']}")
-                    if os.name == "nt":
-                        try:
-                            subprocess.run(["taskkill", "/f", "/im", "rclone.exe"], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                            self._log("Requested taskkill for rclone.exe (Windows).")
-                        except Exception as e:
-                            self._log(f"Failed to taskkill rclone.exe: {e}")
-                    else:
-                        try:
-                            subprocess.run(["fusermount", "-u", drive], check=False)
-                            self._log(f"Ran fusermount -u {drive}")
-                        except Exception:
-                            try:
-                                subprocess.run(["umount", drive], check=False)
-                                self._log(f"Ran umount {drive}")
-                            except Exception as e:
-                                self._log(f"Failed to unmount {drive}: {e}")
-                    try:
-                        self.active_mounts.remove(am)
-                    except ValueError:
-                        pass
-                    self._refresh_active_list()
-                break
-        if not found:
-            messagebox.showinfo("Not found", f"No active mount matching {drive}")
+                        self._log(f"Failed to unmount {drive}: {e}")
+            self._drop_mount(am)
+            self._refresh_active_list()
 
     def unmount_all(self):
         if not self.active_mounts:
-            messagebox.showinfo("No mounts", "No active mounts")
+            self._set_status("No active mounts")
             return
         if not messagebox.askyesno("Confirm", f"Stop {len(self.active_mounts)} mounts?"):
             return
-        for am in list(self.active_mounts):
+        if any(am.get("rc") for am in self.active_mounts):
             try:
-                proc = am.get("proc")
-                if proc:
+                self._rc_call("mount/unmountall")
+                self._log("Unmounted all rcd mounts")
+            except Exception as e:
+                self._log(f"RC unmountall failed: {e}")
+        # Classify first so every external mount is handled in one batch
+        # instead of spawning the same taskkill per mount.
+        procs = []
+        external_drives = []
+        for am in self.active_mounts:
+            if am.get("rc"):
+                continue
+            proc = am.get("proc")
+            if proc:
+                try:
+                    # Terminate everything first; waiting happens afterwards
+                    # with one shared deadline so total latency is O(max).
                     proc.terminate()
+                    procs.append(proc)
+                except Exception as e:
+                    self._log(f"Error stopping pid {getattr(proc, 'pid', None)}: {e}")
+            else:
+                external_drives.append(am.get("drive") or am["mapping"].split("->")[-1].strip())
+        if external_drives:
+            if os.name == "nt":
+                try:
+                    subprocess.run(["taskkill", "/f", "/im", "rclone.exe"], check=False, creationflags=NO_WINDOW, close_fds=True)
+                    self._log("Requested taskkill for rclone.exe (Windows).")
+                except Exception as e:
+                    self._log(f"Error stopping external rclone processes: {e}")
+            else:
+                def unmount_one(drive):
                     try:
-                        proc.wait(timeout=3)
+                        subprocess.run(["fusermount", "-u", drive], check=False)
                     except Exception:
-                        proc.kill()
-                else:
-                    if os.name == "nt":
                         try:
-                            subprocess.run(["taskkill", "/f", "/im", "rclone.exe"], check=False)
-                            self._log("Requested taskkill for rclone.exe (Windows).")
+                            subprocess.run(["umount", drive], check=False)
                         except Exception as e:
-                            self._log(f"Error stopping external rclone processes: {e}")
-                    else:
-                        drive = am["mapping"].split("->")[-1].strip()
-                        try:
-                            subprocess.run(["fusermount", "-u", drive], check=False)
-                        except Exception:
-                            try:
-                                subprocess.run(["umount", drive], check=False)
-                            except Exception as e:
-                                self._log(f"Failed to unmount {drive}: {e}")
-            except Exception as e:
-                self._log(f"Error stopping pid {getattr(am.get('proc'), 'pid', None)}: {e}")
+                            self._log(f"Failed to unmount {drive}: {e}")
+                with ThreadPoolExecutor(max_workers=8) as ex:
+                    list(ex.map(unmount_one, external_drives))
+        if procs:
+            threading.Thread(target=self._reap_procs, args=(procs,), daemon=True).start()
         self.active_mounts.clear()
+        self._mounts_by_drive.clear()
         self._refresh_active_list()
         self._log("All mounts stopped")
         if os.name == "nt":
             if messagebox.askyesno("Restart Explorer?", "Restart Windows Explorer to refresh drive letters?"):
+                threading.Thread(target=self._restart_explorer, daemon=True).start()
+
+    def _restart_explorer(self):
+        # Off the Tk thread: taskkill can take a moment, and explorer
+        # tolerates an immediate relaunch — no sleep, no cmd.exe/start hop.
+        try:
+            subprocess.run(["taskkill", "/f", "/im", "explorer.exe"], check=False, creationflags=NO_WINDOW, close_fds=True)
+            subprocess.Popen(["explorer.exe"], close_fds=True)
+            self._log("Explorer restart requested")
+        except Exception as e:
+            self._log(f"Failed to restart explorer: {e}")
+
+    def _reap_procs(self, procs):
+        # Runs off the UI thread: all procs got terminate() already, so wait
+        # on each against one shared deadline and kill stragglers.
+        deadline = time.time() + 3
+        for proc in procs:
+            try:
+                proc.wait(timeout=max(0, deadline - time.time()))
+            except Exception:
                 try:
-                    subprocess.run(["taskkill", "/f", "/im", "explorer.exe"], check=False)
-                    time.sleep(0.4)
-                    subprocess.Popen("start explorer.exe", shell=True)
-                    self._log("Explorer restart requested")
-                except Exception as e:
-                    messagebox.showwarning("Explorer", f"Failed to restart explorer: {e}")
+                    proc.kill()
+                except Exception:
+                    pass
 
     # ---------- startup files (nircmd-aware) + startup log handling ----------
     def add_selected_to_startup(self):
-        folder = ensure_startup_folder()
+        folder = self._startup_folder
+        if folder:
+            folder.mkdir(parents=True, exist_ok=True)
         if not folder:
             messagebox.showerror("Startup", "Could not determine startup folder")
             return
         entries = []
-        for m in self.mappings:
+        for m in self.mappings.values():
             if m.get("startup"):
                 entries.append((m["remote"], m["label"], m["drive"]))
         if not entries:
-            messagebox.showinfo("No entries", "No mappings selected for startup")
+            self._set_status("No mappings selected for startup")
             return
         if not messagebox.askyesno("Create", f"Create {len(entries)} startup files in {folder}?"):
             return
 
-        log_entries = []
-        nircmd_path = shutil.which("nircmd")
-        if not nircmd_path and self.rclone_path:
-            maybe = Path(self.rclone_path).parent / "nircmd.exe"
-            if maybe.exists():
-                nircmd_path = str(maybe)
-
-        created = 0
+        if self._nircmd_path is None:
+            nircmd_path = cached_which("nircmd", os.environ.get("PATH", ""))
+            if not nircmd_path and self.rclone_path:
+                maybe = Path(self.rclone_path).parent / "nircmd.exe"
+                if maybe.exists():
+                    nircmd_path = str(maybe)
+            self._nircmd_path = nircmd_path or ""
+        nircmd_path = self._nircmd_path
+
+        # Build every (path, content) pair first, then write them in parallel;
+        # AV scanning can make each individual write slow on Windows.
+        # Everything constant across entries is resolved before the loop.
+        conf = self.loaded_conf_path or ""
+        rclone = self.rclone_path
+        rclone_q = shlex.quote(rclone)
+        win_tmpl = STARTUP_CMD_TMPL_NIRCMD if nircmd_path else STARTUP_CMD_TMPL_START
+        # The platform never changes mid-loop, so pick the entry builder once
+        # and keep the loop branch-free.
+        if os.name == "nt":
+            def build(safe_label, remote_q, drive_q):
+                cmdline = win_tmpl.format_map({
+                    "nircmd": nircmd_path, "rclone": rclone, "remote": remote_q,
+                    "drive": drive_q, "conf": conf, "label": safe_label})
+                return folder / f"{STARTUP_PREFIX}{safe_label}.cmd", cmdline, cmdline
+        else:
+            def build(safe_label, remote_q, drive_q):
+                content = STARTUP_DESKTOP_TMPL.format_map({
+                    "prefix": STARTUP_PREFIX, "label": safe_label, "rclone": rclone_q,
+                    "remote": remote_q, "drive": drive_q, "conf": conf})
+                return folder / f"{STARTUP_PREFIX}{safe_label}.desktop", "", content
+        jobs = []
         for remote, label, drive in entries:
+            safe_label = _UNSAFE_LABEL_RE.sub("", label) or "mapping"
+            fpath, cmdline, content = build(safe_label, shlex.quote(remote), shlex.quote(drive))
+            jobs.append((fpath, content.encode("utf-8"), {
+                "label": safe_label,
+                "remote": remote,
+                "drive": drive,
+                "filename": str(fpath),
+                "created_at": int(time.time()),
+                "cmdline": cmdline,
+            }))
+
+        def write_one(job):
+            # Content is pre-encoded once on the UI thread; the workers do a
+            # bare binary write with no TextIOWrapper in the way.
+            fpath, data, log_entry = job
             try:
-                safe_label = "".join(c for c in label if c.isalnum() or c in ("-", "_")).strip() or "mapping"
-                if os.name == "nt":
-                    fname = f"{STARTUP_PREFIX}{safe_label}.cmd"
-                    fpath = folder / fname
-                    if nircmd_path:
-                        cmdline = f'"{nircmd_path}" exec hide "{self.rclone_path}" mount {shlex.quote(remote)} {shlex.quote(drive)} --config "{self.loaded_conf_path or ""}" --vfs-cache-mode writes --log-file "%TEMP%\\rclone_{safe_label}.log" --log-level INFO'
-                    else:
-                        cmdline = f'start "" /min "{self.rclone_path}" mount {shlex.quote(remote)} {shlex.quote(drive)} --config "{self.loaded_conf_path or ""}" --vfs-cache-mode writes --log-file "%TEMP%\\rclone_{safe_label}.log" --log-level INFO'
-                    fpath.write_text(cmdline, encoding="utf-8")
-                else:
-                    fname = f"{STARTUP_PREFIX}{safe_label}.desktop"
-                    fpath = folder / fname
-                    content = (
-                        "[Desktop Entry]\n"
-                        "Type=Application\n"
-                        f"Name={STARTUP_PREFIX}{safe_label}\n"
-                        f'Exec=sh -c "nohup {shlex.quote(self.rclone_path)} mount {shlex.quote(remote)} {shlex.quote(drive)} --config \\"{self.loaded_conf_path or ""}\\" --vfs-cache-mode writes &> /dev/null &"\n'
-                        "X-GNOME-Autostart-enabled=true\n"
-                    )
-                    fpath.write_text(content, encoding="utf-8")
-                created += 1
-                log_entries.append({
-                    "label": safe_label,
-                    "remote": remote,
-                    "drive": drive,
-                    "filename": str(fpath),
-                    "created_at": int(time.time()),
-                    "cmdline": cmdline if 'cmdline' in locals() else ""
-                })
+                with open(fpath, "wb") as f:
+                    f.write(data)
+                return log_entry, None
             except Exception as e:
-                self._log(f"Failed to create startup for {remote}: {e}")
+                return log_entry, e
 
-        try:
-            STARTUP_LOG_PATH.write_text(json.dumps(log_entries, indent=2), encoding="utf-8")
-            self.startup_log = log_entries
-            self._log(f"Wrote startup log with {len(log_entries)} entries to {STARTUP_LOG_PATH}")
-        except Exception as e:
-            self._log(f"Failed to write startup log: {e}")
+        log_entries = []
+        created = 0
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            for log_entry, err in ex.map(write_one, jobs):
+                if err is None:
+                    created += 1
+                    log_entries.append(log_entry)
+                else:
+                    self._log(f"Failed to create startup for {log_entry['remote']}: {err}")
+
+        # Serialize on the UI thread (cheap, compact), write on a worker so
+        # the confirmation dialog isn't gated on a disk sync.
+        self.startup_log = log_entries
+        self._rebuild_startup_index()
+        data = dump_json_bytes(log_entries)
+        def write_log():
+            try:
+                tmp = STARTUP_LOG_PATH.with_suffix(".json.tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, STARTUP_LOG_PATH)
+                self._log(f"Wrote startup log with {len(log_entries)} entries to {STARTUP_LOG_PATH}")
+            except Exception as e:
+                self._log(f"Failed to write startup log: {e}")
+        threading.Thread(target=write_log, daemon=True).start()
 
         messagebox.showinfo("Created", f"Created {created} startup files in {folder}")
 
     def clear_startups(self):
-        folder = get_startup_folder()
+        folder = self._startup_folder
         if not folder or not folder.exists():
             messagebox.showinfo("None", "No startup folder found")
             return
-        files = [p for p in folder.iterdir() if p.is_file() and p.name.startswith(STARTUP_PREFIX)]
+        # scandir + name check first: the prefix test is free, and is_file on
+        # a matching entry reuses the dirent instead of an extra stat each.
+        with os.scandir(folder) as it:
+            files = [entry.path for entry in it
+                     if entry.name.startswith(STARTUP_PREFIX) and entry.is_file(follow_symlinks=False)]
         if not files:
             messagebox.showinfo("None", "No EZMount startup files")
             return
@@ -672,7 +1342,7 @@ class EZMountApp(tk.Tk):
         removed = 0
         for p in files:
             try:
-                p.unlink()
+                os.unlink(p)
                 removed += 1
             except Exception as e:
                 self._log(f"Failed to remove {p}: {e}")
@@ -680,12 +1350,13 @@ class EZMountApp(tk.Tk):
             if STARTUP_LOG_PATH.exists():
                 STARTUP_LOG_PATH.unlink()
                 self.startup_log = []
+                self._rebuild_startup_index()
         except Exception:
             pass
         messagebox.showinfo("Removed", f"Removed {removed} files and cleared startup log")
 
     def open_startup_folder(self):
-        folder = get_startup_folder()
+        folder = self._startup_folder
         if not folder or not folder.exists():
             messagebox.showinfo("No startup folder", "Startup folder not found")
             return
@@ -700,87 +1371,199 @@ class EZMountApp(tk.Tk):
     def _load_startup_log(self):
         try:
             if STARTUP_LOG_PATH.exists():
-                self.startup_log = json.loads(STARTUP_LOG_PATH.read_text(encoding="utf-8") or "[]")
+                self.startup_log = load_json_bytes(STARTUP_LOG_PATH.read_bytes() or b"[]") or []
+                if len(self.startup_log) > STARTUP_LOG_MAX:
+                    # Bound the per-tick scan and the next launch's parse;
+                    # newest entries win. Rewrite off-thread like the other
+                    # log writers.
+                    self.startup_log = self.startup_log[-STARTUP_LOG_MAX:]
+                    data = dump_json_bytes(self.startup_log)
+                    def rewrite():
+                        try:
+                            tmp = STARTUP_LOG_PATH.with_suffix(".json.tmp")
+                            tmp.write_bytes(data)
+                            os.replace(tmp, STARTUP_LOG_PATH)
+                        except Exception:
+                            pass
+                    threading.Thread(target=rewrite, daemon=True).start()
                 self._log(f"Loaded startup log ({len(self.startup_log)} entries) from {STARTUP_LOG_PATH}")
             else:
                 self.startup_log = []
         except Exception as e:
             self._log(f"Failed to load startup log: {e}")
             self.startup_log = []
+        self._rebuild_startup_index()
+
+    def _rebuild_startup_index(self):
+        # The scan only needs (drive, mapping_text) and those never change
+        # between log edits, so derive them once instead of per tick.
+        idx = []
+        for e in self.startup_log:
+            drive = e.get("drive")
+            if not drive:
+                continue
+            remote = e.get("remote") or ""
+            label = e.get("label") or ""
+            idx.append((drive, f"{remote} -> {drive}" if remote else f"{label} -> {drive}"))
+        self._startup_scan_index = idx
 
     def _log(self, text):
+        # Safe to call from any thread: lines are queued and the Tk mainloop
+        # drains them in batches (_drain_log), so one chatty mount doesn't
+        # force a widget update per line.
+        self._log_queue.put(text)
+
+    def _drain_log(self):
+        lines = []
         try:
-            self.txt_log.configure(state="normal")
-            self.txt_log.insert("end", text + "\n")
-            txt = self.txt_log.get("1.0", "end")
-            if len(txt) > LOG_MAX_CHARS:
-                self.txt_log.delete("1.0", "end")
-                self.txt_log.insert("end", txt[-LOG_MAX_CHARS:])
-            self.txt_log.see("end")
-            self.txt_log.configure(state="disabled")
-        except Exception:
+            while len(lines) < 200:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
             pass
+        if lines:
+            txt = self.txt_log
+            try:
+                txt.configure(state="normal")
+                # Ring buffer: drop exactly the overflowing oldest lines
+                # instead of copying the whole buffer out and back in.
+                overflow = len(self._log_lines) + len(lines) - self._log_lines.maxlen
+                if overflow > 0:
+                    txt.delete("1.0", f"{overflow + 1}.0")
+                self._log_lines.extend(lines)
+                txt.insert("end", "\n".join(lines) + "\n")
+                txt.see("end")
+                txt.configure(state="disabled")
+            except Exception:
+                pass
+        self.after(50, self._drain_log)
 
     def _refresh_active_list(self):
-        self.lst_active.delete(0, "end")
+        rows = []
         for am in self.active_mounts:
             pid = getattr(am["proc"], "pid", "N/A") if am.get("proc") else "N/A"
-            started = time.strftime("%H:%M:%S", time.localtime(am["started_at"])) if am.get("started_at") else "-"
+            started = am.get("started_str", "-")
             det = " (detected)" if am.get("detected") else ""
             src = " [startup]" if am.get("from_startup_log") else ""
-            self.lst_active.insert("end", f"{am['mapping']}  pid={pid}  started={started}{det}{src}")
+            # Fixed template + %-formatting takes CPython's fast path for
+            # this per-row, per-tick string build.
+            rows.append("%s  pid=%s  started=%s%s%s" % (am["mapping"], pid, started, det, src))
+        # Patch only rows that changed instead of clearing and rewriting the
+        # whole Listbox on every tick.
+        old = self._active_rows
+        if rows == old:
+            return
+        lb = self.lst_active
+        for i, row in enumerate(rows):
+            if i < len(old):
+                if old[i] != row:
+                    lb.delete(i)
+                    lb.insert(i, row)
+            else:
+                lb.insert("end", row)
+        for _ in range(len(old) - len(rows)):
+            lb.delete(len(rows))
+        self._active_rows = rows
 
     def _refresh_status_periodic(self):
         changed = False
-        for am in list(self.active_mounts):
-            if am.get("proc") and am["proc"].poll() is not None:
-                try:
-                    self.active_mounts.remove(am)
-                except ValueError:
-                    pass
-                changed = True
+        exited = []
+        try:
+            while True:
+                exited.append(self._exited_q.get_nowait())
+        except queue.Empty:
+            pass
+        if exited:
+            # Collect the (typically tiny) removal set first instead of
+            # shadow-copying the whole list just to mutate during iteration.
+            to_remove = [am for am in self.active_mounts if am.get("proc") in exited]
+            for am in to_remove:
+                self._drop_mount(am)
+            changed = bool(to_remove)
         self.scan_for_external_mounts()
         if changed:
             self._refresh_active_list()
-        self.after(2000, self._refresh_status_periodic)
-
-    def scan_for_external_mounts(self):
-        detected_now = []
-        for m in self.mappings:
+        # Poll fast while the user is active, slow right down when the app
+        # has been sitting idle; exits still arrive promptly via _exited_q.
+        idle = time.monotonic() - self._last_user_event
+        interval = 2000 if idle < 5 else 5000 if idle < 60 else 15000
+        self.after(interval, self._refresh_status_periodic)
+
+    def _note_user_event(self, _event=None):
+        self._last_user_event = time.monotonic()
+
+    def scan_for_external_mounts(self, force=False):
+        # Drive enumeration can be slow with network drives around; keep the
+        # last scan for a few seconds unless a conf load wants fresh truth.
+        now = time.monotonic()
+        if not force and now - self._last_ext_scan < 5.0:
+            return
+        # Nothing to probe and nothing to prune: skip the tick entirely.
+        if not self.mappings and not self.startup_log and not self.active_mounts:
+            return
+        if self._scan_inflight:
+            return
+        self._last_ext_scan = now
+        # Snapshot the candidates on the Tk thread, probe them on a worker so
+        # a slow or dead drive never stalls the UI, then apply the results
+        # back on the Tk thread.
+        # Bind the append once; with big confs these loops run over every
+        # mapping each tick.
+        candidates = []
+        append = candidates.append
+        for m in self.mappings.values():
             d = m.get("drive", "").strip()
-            if not d:
-                continue
-            if self._is_drive_in_use(d):
-                mapping_text = f"{m.get('remote','').strip()} -> {d}"
-                if not any(am["mapping"] == mapping_text for am in self.active_mounts):
-                    self.active_mounts.append({"mapping": mapping_text, "proc": None, "started_at": time.time(), "detected": True, "from_startup_log": False})
-                    self._log(f"Detected external mount (from mappings): {mapping_text}")
-                detected_now.append(mapping_text)
-
-        for entry in self.startup_log:
-            drive = entry.get("drive")
-            remote = entry.get("remote") or ""
-            label = entry.get("label") or ""
-            if not drive:
-                continue
-            if self._is_drive_in_use(drive):
-                mapping_text = f"{remote} -> {drive}" if remote else f"{label} -> {drive}"
-                if not any(am["mapping"] == mapping_text for am in self.active_mounts):
-                    self.active_mounts.append({"mapping": mapping_text, "proc": None, "started_at": time.time(), "detected": True, "from_startup_log": True})
-                    self._log(f"Detected external mount (from startup log): {mapping_text}")
-                detected_now.append(mapping_text)
-
-        removed = []
-        for am in list(self.active_mounts):
-            if am.get("detected"):
-                if am["mapping"] not in detected_now:
-                    try:
-                        self.active_mounts.remove(am)
-                        removed.append(am["mapping"])
-                    except ValueError:
-                        pass
-        if removed:
-            self._log(f"Removed stale detected mounts: {removed}")
+            if d:
+                append((d, f"{m.get('remote','').strip()} -> {d}", False))
+        for drive, mapping_text in self._startup_scan_index:
+            append((drive, mapping_text, True))
+        self._scan_inflight = True
+        threading.Thread(target=self._scan_worker, args=(candidates,), daemon=True).start()
+
+    def _scan_worker(self, candidates):
+        # The same drive letter can appear in both sources; probe each drive
+        # at most once, against a single mask fetch on Windows.
+        # One bulk fetch per scan on each platform: the drive bitmask on
+        # Windows, the mount table on Linux; anything else falls back to the
+        # memoized per-path probe.
+        mask = get_logical_drive_mask() if os.name == "nt" else None
+        mounts = None if os.name == "nt" else get_posix_mount_points()
+        probed = {}
+        hits = []
+        probe = self._is_drive_in_use
+        try:
+            for drive, mapping_text, from_startup in candidates:
+                v = probed.get(drive)
+                if v is None:
+                    if mounts is not None:
+                        v = drive in mounts or drive.rstrip("/") in mounts
+                    else:
+                        v = probe(drive, mask)
+                    probed[drive] = v
+                if v:
+                    hits.append((drive, mapping_text, from_startup))
+        finally:
+            self.after(0, self._apply_scan_results, hits)
+
+    def _apply_scan_results(self, hits):
+        self._scan_inflight = False
+        # One set built up front makes every membership test O(1) instead of
+        # rescanning active_mounts per candidate.
+        active_keys = {am["mapping"] for am in self.active_mounts}
+        detected_now = set()
+        for drive, mapping_text, from_startup in hits:
+            if mapping_text not in active_keys:
+                self._add_mount({"mapping": mapping_text, "drive": drive, "proc": None, "started_at": time.time(), "detected": True, "from_startup_log": from_startup})
+                active_keys.add(mapping_text)
+                src = "startup log" if from_startup else "mappings"
+                self._log(f"Detected external mount (from {src}): {mapping_text}")
+            detected_now.add(mapping_text)
+
+        stale = [am for am in self.active_mounts
+                 if am.get("detected") and am["mapping"] not in detected_now]
+        for am in stale:
+            self._drop_mount(am)
+        if stale:
+            self._log(f"Removed stale detected mounts: {[am['mapping'] for am in stale]}")
         self._refresh_active_list()
 
 if __name__ == "__main__":